@@ -1,36 +1,50 @@
 class PromptException(Exception):
+    status_code = 500  # Internal Server Error (Generic fallback)
+
     def __init__(self, message: str):
         self.message = message
         super().__init__(self.message)
 
 
 class DBConnectionError(PromptException):
+    status_code = 500  # Internal Server Error
+
     def __init__(self, message="Failed to connect to the database."):
         super().__init__(message)
 
 
 class RecordNotFoundError(PromptException):
+    status_code = 404  # Not Found
+
     def __init__(self, message="The requested record was not found."):
         super().__init__(message)
 
 
 class ConstraintViolationError(PromptException):
+    status_code = 409  # Conflict
+
     def __init__(self, message="Database constraint was violated."):
         super().__init__(message)
 
 # 2. Service Layer Exceptions
 
 class DataValidationError(PromptException):
+    status_code = 400  # Bad Request
+
     def __init__(self, message="Provided data is invalid."):
         super().__init__(message)
 
 
 class UnauthorizedError(PromptException):
+    status_code = 401  # Unauthorized
+
     def __init__(self, message="Unauthorized access."):
         super().__init__(message)
 
 
 class OperationNotAllowedError(PromptException):
+    status_code = 403  # Forbidden
+
     def __init__(self, message="This operation is not allowed."):
         super().__init__(message)
 
@@ -38,28 +52,21 @@ class OperationNotAllowedError(PromptException):
 # 3. Web Layer Exceptions
 
 class BadRequestError(PromptException):
+    status_code = 400  # Bad Request
+
     def __init__(self, message="Bad request data."):
         super().__init__(message)
 
 
 class EndpointNotFoundError(PromptException):
+    status_code = 404  # Not Found
+
     def __init__(self, message="Endpoint not found."):
         super().__init__(message)
 
 
 class AuthenticationError(PromptException):
+    status_code = 401  # Unauthorized
+
     def __init__(self, message="Authentication failed."):
         super().__init__(message)
-
-EXCEPTION_STATUS_CODES = {
-    DataValidationError: 400,       # Bad Request
-    ConstraintViolationError: 409,  # Conflict
-    PromptException: 500,           # Internal Server Error (Generic fallback)
-    DBConnectionError: 500,         # Internal Server Error (Generic fallback)
-    RecordNotFoundError: 404,       # Not Found
-    UnauthorizedError: 401,         # Unauthorized
-    OperationNotAllowedError: 403,  # Forbidden
-    BadRequestError: 400,           # Bad Request
-    EndpointNotFoundError: 404,     # Not Found
-    AuthenticationError: 401,       # Unauthorized
-}
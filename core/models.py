@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional
 
@@ -24,6 +25,20 @@ class Prompt(PromptUpdate):
     updated_at: datetime
 
 
+@dataclass(slots=True)
+class PromptRow:
+    # Plain mirror of Prompt (same fields, same order) for rows read from the database. The data is
+    # already typed by the schema, so it is validated once, as a Prompt, only when FastAPI serializes the
+    # response; the NDJSON stream writes rows with orjson as-is.
+    content: str
+    display_name: str
+    tags: List[str]
+    id: int
+    guid: str
+    created_at: datetime
+    updated_at: datetime
+
+
 class User(BaseModel):
     username: str
     password: str
@@ -1,4 +1,7 @@
+from contextlib import contextmanager
+
 from mysql.connector import pooling
+from mysql.connector.constants import ClientFlag
 from dotenv import load_dotenv
 import os
 import threading
@@ -14,41 +17,130 @@ config = {
     'port': os.getenv('DB_PORT'),
     'database': os.getenv('DB_NAME'),
     'raise_on_warnings': True,
+    # Writes are grouped into explicit transactions (see DatabaseContext.transaction)
+    'autocommit': False,
+    # Report matched rather than changed rows, so an owner-filtered UPDATE that changes nothing still counts
+    'client_flags': [ClientFlag.FOUND_ROWS],
 }
 
 
 # Create a thread-local storage
 local_storage = threading.local()
 
-# Create a connection pool
-db_pool = pooling.MySQLConnectionPool(pool_name="pool", pool_size=10, **config)
+# Connection pool size, capped at the largest pool mysql-connector allows
+pool_size = min(int(os.getenv('DB_POOL_SIZE', 10)), pooling.CNX_POOL_MAXSIZE)
+
+# The connection pool, created once by init_db_pool() (normally at application startup)
+db_pool = None
+db_pool_lock = threading.Lock()
+
+# Interned result column-name tuples, keyed by the layout itself. Entries are bounded by the distinct
+# result layouts rather than by SQL text, whose IN (...) lists vary with client input. Returning one
+# shared tuple per layout lets callers cache work keyed by column_names.
+column_names_cache = {}
+
+
+class RowCursor:
+    # Wraps a tuple-returning cursor and builds dict rows from column names read once per statement,
+    # rather than having a dictionary cursor recompute them from the result description on every row.
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.column_names = ()
+
+    def execute(self, sql, params=()):
+        self._cursor.execute(sql, params)
+        if self._cursor.description is None:
+            self.column_names = ()
+        else:
+            column_names = tuple(self._cursor.column_names)
+            self.column_names = column_names_cache.setdefault(column_names, column_names)
+
+    def executemany(self, sql, seq_params):
+        self._cursor.executemany(sql, seq_params)
+        self.column_names = ()
+        if self._cursor.with_rows:
+            self._cursor.fetchall()  # Drain any rows so the connection is free for the next statement
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        return None if row is None else dict(zip(self.column_names, row))
+
+    def fetchall(self):
+        column_names = self.column_names
+        return [dict(zip(column_names, row)) for row in self._cursor.fetchall()]
+
+    def fetchone_row(self):
+        # Raw tuple in column_names order, for callers that index columns by position
+        return self._cursor.fetchone()
+
+    def fetchall_rows(self):
+        return self._cursor.fetchall()
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    def close(self):
+        self._cursor.close()
+
+
+def init_db_pool():
+    global db_pool
+    with db_pool_lock:
+        if db_pool is None:
+            db_pool = pooling.MySQLConnectionPool(pool_name="pool", pool_size=pool_size, **config)
+    return db_pool
 
 
 class DatabaseContext:
     def __init__(self):
         self._cursor = None
+        self._row_cursor = None
 
     def __enter__(self):
-        self.conn = db_pool.get_connection()
+        self.conn = (db_pool or init_db_pool()).get_connection()
         self.cursor = self.conn.cursor(dictionary=True)
+        self._row_cursor = RowCursor(self.conn.cursor())
         # Store the context in thread-local storage
         local_storage.db_context = self
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         try:
+            # Drain a streamed result abandoned part way (bounded by its query's LIMIT) first:
+            # no other command, including the rollback, can be sent while it is unread
+            if self.conn.unread_result:
+                self.conn.consume_results()
             if exc_type is not None:
                 self.conn.rollback()  # Rollback transaction if an exception was raised
+            self._row_cursor.close()
             self.cursor.close()
-            self.conn.close()  # Close the connection regardless of exception status
         finally:
-            # Remove context from local storage
-            del local_storage.db_context
+            try:
+                self.conn.close()  # Return the connection to the pool regardless of exception status
+            finally:
+                # Remove context from local storage. A streaming generator may be closed on a different
+                # thread than the one that entered the context, so only clear it if it is still ours.
+                if getattr(local_storage, "db_context", None) is self:
+                    del local_storage.db_context
 
     @property
     def cursor(self):
         return self._cursor
 
+    def execute(self, sql, params=()):
+        # Run sql as a single text-protocol query (one round-trip) on the context's row cursor.
+        # Server-side prepared statements are not used: they would not outlive this context, since the
+        # pool resets the session on return, so every query would pay an extra PREPARE and CLOSE.
+        self._row_cursor.execute(sql, tuple(params))
+        return self._row_cursor
+
+    def executemany(self, sql, seq_params):
+        # Run sql once per parameter tuple on the same row cursor as execute. The connector rewrites an
+        # INSERT ... VALUES into one multi-row statement, so that case is still a single round-trip.
+        self._row_cursor.executemany(sql, [tuple(params) for params in seq_params])
+        return self._row_cursor
+
     # Exposing transactional methods for use in service layer
     def begin_transaction(self):
         self.conn.start_transaction()
@@ -59,6 +151,18 @@ class DatabaseContext:
     def rollback_transaction(self):
         self.conn.rollback()
 
+    @contextmanager
+    def transaction(self):
+        # Run the block as one transaction: a single commit on success, rollback on any error
+        self.begin_transaction()
+        try:
+            yield self
+        except BaseException:
+            self.rollback_transaction()
+            raise
+        else:
+            self.commit_transaction()
+
     @cursor.setter
     def cursor(self, value):
         self._cursor = value
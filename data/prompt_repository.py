@@ -1,10 +1,163 @@
-from typing import List, Optional
+from itertools import combinations
+from typing import Iterator, List, Optional
+
+import orjson
 
 import core
 from core.exceptions import UnauthorizedError
-from core.models import Prompt, PromptCreate, PromptUpdate, User
+from core.models import PromptCreate, PromptRow, PromptUpdate, User
 from data import get_current_db_context
 
+# SQL templates. Author filters use the NULL-safe <=> operator, so a None user matches public
+# (NULL author) prompts and each query stays one static string.
+# Templates with {placeholders} are expanded to one %s per value of an IN (...) list.
+
+_INSERT_PROMPT_SQL = "INSERT INTO prompts (guid, content, display_name, author) VALUES (%s, %s, %s, %s)"
+
+# Prompt columns that update_prompt may set (tags are stored separately)
+_UPDATABLE_PROMPT_FIELDS = tuple(field for field in PromptUpdate.model_fields if field != "tags")
+
+# One UPDATE statement per combination of fields being set, keyed by the field tuple in declaration order.
+# Ownership is enforced by the WHERE clause rather than a separate lookup.
+_UPDATE_PROMPT_SQL = {
+    fields: f"UPDATE prompts SET {', '.join(f'{field} = %s' for field in fields)} WHERE guid = %s AND author <=> %s"
+    for count in range(1, len(_UPDATABLE_PROMPT_FIELDS) + 1)
+    for fields in combinations(_UPDATABLE_PROMPT_FIELDS, count)
+}
+
+# prompt_tags rows go with the prompt through the ON DELETE CASCADE foreign key
+_DELETE_PROMPT_SQL = "DELETE FROM prompts WHERE guid = %s AND author <=> %s"
+
+_GET_PROMPT_AUTHOR_SQL = "SELECT author FROM prompts WHERE guid = %s"
+
+# A single-row lookup on the unique guid key
+_CHECK_PROMPT_OWNER_SQL = "SELECT 1 FROM prompts WHERE guid = %s AND author <=> %s"
+
+_GET_PROMPT_SQL = """
+    SELECT prompts.*, tags.tag
+    FROM prompts
+    LEFT JOIN prompt_tags ON prompts.id = prompt_tags.prompt_id
+    LEFT JOIN tags ON prompt_tags.tag_id = tags.id
+    WHERE prompts.guid = %s AND prompts.author <=> %s
+    ORDER BY prompts.id
+"""
+
+_GET_PROMPT_BY_NAME_SQL = """
+    SELECT prompts.*, tags.tag
+    FROM prompts
+    LEFT JOIN prompt_tags ON prompts.id = prompt_tags.prompt_id
+    LEFT JOIN tags ON prompt_tags.tag_id = tags.id
+    WHERE prompts.display_name = %s AND prompts.author <=> %s
+    ORDER BY prompts.id
+"""
+
+_LIST_PROMPTS_SQL = """
+    SELECT prompts.*, tags.tag
+    FROM prompts
+    LEFT JOIN prompt_tags ON prompts.id = prompt_tags.prompt_id
+    LEFT JOIN tags ON prompt_tags.tag_id = tags.id
+    WHERE prompts.author <=> %s
+    ORDER BY prompts.id
+"""
+
+# Paginates on prompts (not on the joined tag rows) so a page always holds whole prompts
+_LIST_PROMPTS_PAGE_SQL = """
+    SELECT prompts.*, tags.tag
+    FROM (SELECT * FROM prompts WHERE author <=> %s ORDER BY id LIMIT %s OFFSET %s) AS prompts
+    LEFT JOIN prompt_tags ON prompts.id = prompt_tags.prompt_id
+    LEFT JOIN tags ON prompt_tags.tag_id = tags.id
+    ORDER BY prompts.id
+"""
+
+_LIST_PROMPTS_BY_TAGS_SQL = """
+    SELECT prompts.*, JSON_ARRAYAGG(tags.tag) as tags
+    FROM prompts
+    LEFT JOIN prompt_tags ON prompts.id = prompt_tags.prompt_id
+    LEFT JOIN tags ON prompt_tags.tag_id = tags.id
+    WHERE tags.tag IN ({placeholders}) AND prompts.author <=> %s
+    GROUP BY prompts.id
+"""
+
+_GET_PROMPT_TAGS_SQL = """
+    SELECT tags.tag
+      FROM prompt_tags
+     INNER JOIN prompts ON prompt_tags.prompt_id = prompts.id
+     INNER JOIN tags ON prompt_tags.tag_id = tags.id
+     WHERE prompts.guid = %s AND prompts.author <=> %s
+"""
+
+_ADD_TAG_SQL = """
+    INSERT INTO tags (tag)
+    VALUES (%s) AS new
+    ON DUPLICATE KEY UPDATE tag = new.tag
+"""
+
+_LINK_TAG_SQL = """
+    INSERT INTO prompt_tags (prompt_id, tag_id)
+      SELECT prompts.id, tags.id
+        FROM prompts, tags
+       WHERE prompts.guid = %s AND tags.tag = %s AND prompts.author <=> %s
+"""
+
+_LINK_TAGS_SQL = """
+    INSERT INTO prompt_tags (prompt_id, tag_id)
+      SELECT prompts.id, tags.id
+        FROM prompts
+        JOIN tags ON tags.tag IN ({placeholders})
+       WHERE prompts.guid = %s AND prompts.author <=> %s
+"""
+
+_REMOVE_TAG_SQL = """
+    DELETE prompt_tags
+      FROM prompt_tags
+     INNER JOIN prompts ON prompt_tags.prompt_id = prompts.id
+     INNER JOIN tags ON prompt_tags.tag_id = tags.id
+     WHERE prompts.guid = %s AND tags.tag = %s AND prompts.author <=> %s
+"""
+
+_REMOVE_TAGS_SQL = """
+    DELETE prompt_tags
+      FROM prompt_tags
+     INNER JOIN prompts ON prompt_tags.prompt_id = prompts.id
+     INNER JOIN tags ON prompt_tags.tag_id = tags.id
+     WHERE prompts.guid = %s AND tags.tag IN ({placeholders}) AND prompts.author <=> %s
+"""
+
+
+def _username(user: Optional[User]) -> Optional[str]:
+    return user.username if user else None
+
+
+def _placeholders(count: int) -> str:
+    return ", ".join(["%s"] * count)
+
+
+# PromptRow fields read straight from a prompts.* column of the same name
+_PROMPT_ROW_COLUMNS = ("content", "display_name", "id", "guid", "created_at", "updated_at")
+
+# Generated row -> PromptRow converters, keyed by the result column names they were built for
+_prompt_row_converters = {}
+
+
+def _load_tags(value) -> List[str]:
+    # Tags aggregated with JSON_ARRAYAGG arrive as a JSON array
+    return orjson.loads(value) if value else []
+
+
+def _prompt_row_converter(column_names):
+    # Build, once per column layout, a straight-line function turning a result tuple into a PromptRow
+    # by position. A "tags" column is parsed as a JSON array; otherwise tags start empty for the caller
+    # to fill from the per-row "tag" column.
+    converter = _prompt_row_converters.get(column_names)
+    if converter is None:
+        index = {name: position for position, name in enumerate(column_names)}
+        args = [f"{column}=row[{index[column]}]" for column in _PROMPT_ROW_COLUMNS]
+        args.append(f"tags=_load_tags(row[{index['tags']}])" if "tags" in index else "tags=[]")
+        namespace = {"PromptRow": PromptRow, "_load_tags": _load_tags}
+        exec(f"def convert(row):\n    return PromptRow({', '.join(args)})\n", namespace)
+        converter = _prompt_row_converters[column_names] = namespace["convert"]
+    return converter
+
 
 class PromptRepositoryInterface:
 
@@ -20,11 +173,11 @@ class PromptRepositoryInterface:
         # Implementation of the delete prompt use case
         pass
 
-    def get_prompt(self, guid: str, user: Optional[User] = None) -> Prompt:
+    def get_prompt(self, guid: str, user: Optional[User] = None) -> PromptRow:
         # Implementation of the get prompt use case
         pass
 
-    def get_prompt_by_name(self, name: str, user: Optional[User] = None) -> Prompt:
+    def get_prompt_by_name(self, name: str, user: Optional[User] = None) -> PromptRow:
         # Implementation of the get prompt use case
         pass
 
@@ -36,10 +189,14 @@ class PromptRepositoryInterface:
         # Implementation of the remove tag from prompt use case
         pass
 
-    def list_prompts(self, user: Optional[User] = None) -> List[Prompt]:
+    def list_prompts(self, user: Optional[User] = None) -> List[PromptRow]:
         # Implementation of the list all public prompts use case
         pass
-    def list_prompts_by_tags(self, tags_list: List[str], user: Optional[User] = None) -> List[Prompt]:
+
+    def list_prompts_stream(self, user: Optional[User] = None, skip: int = 0, limit: int = 100) -> Iterator[PromptRow]:
+        # Implementation of the list prompts use case for one page, yielding prompts as rows are read
+        pass
+    def list_prompts_by_tags(self, tags_list: List[str], user: Optional[User] = None) -> List[PromptRow]:
       # Implementation of the list all prompts use case by tags
         pass
 
@@ -48,9 +205,9 @@ class MySQLPromptRepository(PromptRepositoryInterface):
     def create_prompt(self, prompt: PromptCreate, author: Optional[User] = None) -> str:
         db = get_current_db_context()
         prompt_guid = core.make_guid()
-        db.cursor.execute(
-            "INSERT INTO prompts (guid, content, display_name, author) VALUES (%s, %s, %s, %s)",
-            (prompt_guid, prompt.content, prompt.display_name, author.username if author else None)
+        db.execute(
+            _INSERT_PROMPT_SQL,
+            (prompt_guid, prompt.content, prompt.display_name, _username(author))
         )
         self._update_tags(prompt_guid, prompt.tags, author)
         return prompt_guid
@@ -58,36 +215,23 @@ class MySQLPromptRepository(PromptRepositoryInterface):
     def update_prompt(self, guid: str, prompt: PromptUpdate, user: Optional[User] = None) -> None:
         db = get_current_db_context()
 
-        # Base SQL query
-        sql = "UPDATE prompts "
-
-        # Parameters for SQL query
-        params = []
+        # The fields explicitly set to a value pick one of the precomputed UPDATE statements
+        fields = tuple(field for field in _UPDATABLE_PROMPT_FIELDS
+                       if field in prompt.model_fields_set and getattr(prompt, field) is not None)
 
-        setting_a_field = False
-        # Iterate over the fields of the PromptUpdate object
-        for field in prompt.dict(exclude_unset=True):
-
-            # Skip the 'guid' and 'tags' fields
-            if field not in ['guid', 'tags'] and getattr(prompt, field) is not None:
-                # If this is the first field being updated, add the SET keyword
-                if not setting_a_field:
-                    sql += "SET "
-                    setting_a_field = True
-                sql += f"{field} = %s, "
-                params.append(getattr(prompt, field))
-
-        if not setting_a_field and prompt.tags is None:
+        if not fields and prompt.tags is None:
             raise core.exceptions.DataValidationError("No fields to update")
 
-        if setting_a_field:
-            # Remove the trailing comma and space
-            sql = sql.rstrip(', ')
-
-            sql += " WHERE guid = %s"
+        if fields:
+            params = [getattr(prompt, field) for field in fields]
             params.append(guid)
+            params.append(_username(user))
 
-            db.cursor.execute(sql, params)
+            cursor = db.execute(_UPDATE_PROMPT_SQL[fields], params)
+            if cursor.rowcount == 0:
+                self._raise_unmatched_prompt(guid)
+        else:
+            self._check_prompt_ownership(guid, user)
 
         # Update the tags if they are provided
         if prompt.tags is not None:
@@ -95,233 +239,134 @@ class MySQLPromptRepository(PromptRepositoryInterface):
 
     def delete_prompt(self, guid: str, user: Optional[User] = None) -> None:
         db = get_current_db_context()
-        self._check_prompt_ownership(guid, user)
-        db.cursor.execute(
-            "DELETE FROM prompts WHERE guid = %s",
-            (guid,)
-        )
-        self.remove_all_tags_from_prompt(guid, user)
+        cursor = db.execute(_DELETE_PROMPT_SQL, (guid, _username(user)))
+        if cursor.rowcount == 0:
+            self._raise_unmatched_prompt(guid)
 
     @staticmethod
     def _check_prompt_ownership(guid, user):
         db = get_current_db_context()
-        query = "SELECT author FROM prompts WHERE guid = %s"
-        params = (guid,)
-        db.cursor.execute(query, params)
-        author = db.cursor.fetchone()['author']
-        if author != (user.username if user else None):
-            raise UnauthorizedError(f"Attempting to update a prompt that does not belong to the user or is not NULL.")
+        cursor = db.execute(_CHECK_PROMPT_OWNER_SQL, (guid, _username(user)))
+        if cursor.fetchone() is None:
+            MySQLPromptRepository._raise_unmatched_prompt(guid)
 
-
-    def get_prompt(self, guid: str, user: Optional[User] = None) -> Prompt:
+    @staticmethod
+    def _raise_unmatched_prompt(guid):
+        # An owner-filtered write matched no rows: report whether the prompt is missing or not the user's
         db = get_current_db_context()
-
-        # Base SQL query
-        sql = """
-            SELECT prompts.*, GROUP_CONCAT(tags.tag) as tags 
-            FROM prompts 
-            LEFT JOIN prompt_tags ON prompts.id = prompt_tags.prompt_id 
-            LEFT JOIN tags ON prompt_tags.tag_id = tags.id 
-            WHERE prompts.guid = %s
-        """
-
-        # Parameters for SQL query
-        params = [guid]
-
-        # If user is not None, add the author clause and parameter.
-        # Also allow public prompts with NULL author to be returned.
-        if user is not None:
-            sql += " AND prompts.author = %s"
-            params.append(user.username)
-        else:
-            sql += " AND prompts.author IS NULL"
-
-        sql += " GROUP BY prompts.id"
-
-        db.cursor.execute(sql, params)
-        result = db.cursor.fetchone()
-        if result is None:
+        cursor = db.execute(_GET_PROMPT_AUTHOR_SQL, (guid,))
+        if cursor.fetchone() is None:
             raise core.exceptions.RecordNotFoundError("Prompt not found")
+        raise UnauthorizedError("Attempting to modify a prompt that does not belong to the user or is not NULL.")
 
-        # Access the result via column names
-        result_dict = self.make_result_dict(result)
 
-        return Prompt(**result_dict)
+    def get_prompt(self, guid: str, user: Optional[User] = None) -> PromptRow:
+        db = get_current_db_context()
+        cursor = db.execute(_GET_PROMPT_SQL, (guid, _username(user)))
+        prompts = self.make_prompts(cursor.column_names, cursor.fetchall_rows())
+        if not prompts:
+            raise core.exceptions.RecordNotFoundError("Prompt not found")
+        return prompts[0]
 
     @staticmethod
-    def make_result_dict(result):
-        result_dict = {
-            "id": result["id"],
-            "content": result["content"],
-            "display_name": result["display_name"],
-            "author": result["author"],
-            "tags": result["tags"].split(',') if result["tags"] else [],  # Split tags by comma
-            "guid": result["guid"],
-            "created_at": result["created_at"],
-            "updated_at": result["updated_at"],
-        }
-        return result_dict
-
-    def get_prompt_by_name(self, name: str, user: Optional[User] = None) -> Prompt:
+    def make_prompts(column_names, rows) -> List[PromptRow]:
+        # Group the flat (prompt, tag) rows into one PromptRow per id, keeping row order
+        make_prompt = _prompt_row_converter(column_names)
+        id_index = column_names.index("id")
+        tag_index = column_names.index("tag")
+        prompts = {}
+        for row in rows:
+            prompt = prompts.get(row[id_index])
+            if prompt is None:
+                prompt = prompts[row[id_index]] = make_prompt(row)
+            if row[tag_index] is not None:
+                prompt.tags.append(row[tag_index])
+        return list(prompts.values())
+
+    def get_prompt_by_name(self, name: str, user: Optional[User] = None) -> PromptRow:
         db = get_current_db_context()
-
-        # Base SQL query
-        sql = """
-            SELECT prompts.*, GROUP_CONCAT(tags.tag) as tags
-            FROM prompts
-            LEFT JOIN prompt_tags ON prompts.id = prompt_tags.prompt_id
-            LEFT JOIN tags ON prompt_tags.tag_id = tags.id
-            WHERE prompts.display_name = %s
-        """
-
-        # Parameters for SQL query
-        params = [name]
-
-        # If user is not None, add the author clause and parameter
-        if user is not None:
-            sql += " AND prompts.author = %s"
-            params.append(user.username)
-        else:
-            sql += " AND prompts.author IS NULL"
-
-        sql += " GROUP BY prompts.id"
-
-        db.cursor.execute(sql, params)
-        result = db.cursor.fetchone()
-        if result is None:
+        cursor = db.execute(_GET_PROMPT_BY_NAME_SQL, (name, _username(user)))
+        prompts = self.make_prompts(cursor.column_names, cursor.fetchall_rows())
+        if not prompts:
             raise core.exceptions.RecordNotFoundError("Prompt not found")
-        result_dict = self.make_result_dict(result)
-        return Prompt(**result_dict)
+        return prompts[0]
 
     def add_tag_to_prompt(self, guid: str, tag: str, user: Optional[User] = None) -> None:
         db = get_current_db_context()
-        db.cursor.execute("""
-            INSERT INTO tags (tag) 
-            VALUES (%s) AS new 
-            ON DUPLICATE KEY UPDATE tag = new.tag
-        """, (tag,))
-
-        # Base SQL query
-        sql = """
-            INSERT INTO prompt_tags (prompt_id, tag_id) 
-              SELECT prompts.id, tags.id 
-                FROM prompts, tags 
-               WHERE prompts.guid = %s AND tags.tag = %s
-        """
-
-        # Parameters for SQL query
-        params = [guid, tag]
-
-        # If user is not None, add the author clause and parameter
-        if user is not None:
-            sql += " AND prompts.author = %s"
-            params.append(user.username)
-        else:
-            sql += " AND prompts.author IS NULL"
-
-        db.cursor.execute(sql, params)
+        db.execute(_ADD_TAG_SQL, (tag,))
+        db.execute(_LINK_TAG_SQL, (guid, tag, _username(user)))
 
     def remove_tag_from_prompt(self, guid: str, tag: str, user: Optional[User] = None) -> None:
         db = get_current_db_context()
+        db.execute(_REMOVE_TAG_SQL, (guid, tag, _username(user)))
 
-        # Base SQL query
-        sql = """
-            DELETE prompt_tags 
-              FROM prompt_tags 
-             INNER JOIN prompts ON prompt_tags.prompt_id = prompts.id 
-             INNER JOIN tags ON prompt_tags.tag_id = tags.id 
-             WHERE prompts.guid = %s AND tags.tag = %s
-        """
-
-        # Parameters for SQL query
-        params = [guid, tag]
-
-        # If user is not None, add the author clause and parameter
-        if user is not None:
-            sql += " AND prompts.author = %s"
-            params.append(user.username)
-        else:
-            sql += " AND prompts.author IS NULL"
-
-        db.cursor.execute(sql, params)
+    def list_prompts(self, user: Optional[User] = None) -> List[PromptRow]:
+        db = get_current_db_context()
+        cursor = db.execute(_LIST_PROMPTS_SQL, (_username(user),))
+        return self.make_prompts(cursor.column_names, cursor.fetchall_rows())
 
-    def list_prompts(self, user: Optional[User] = None) -> List[Prompt]:
+    def list_prompts_stream(self, user: Optional[User] = None, skip: int = 0, limit: int = 100) -> Iterator[PromptRow]:
         db = get_current_db_context()
+        # The row cursor is unbuffered, so rows are read from the server one at a time.
+        # Rows are ordered by prompt id, so a prompt is complete once the next id appears.
+        cursor = db.execute(_LIST_PROMPTS_PAGE_SQL, (_username(user), limit, skip))
+        make_prompt = _prompt_row_converter(cursor.column_names)
+        id_index = cursor.column_names.index("id")
+        tag_index = cursor.column_names.index("tag")
+        prompt = None
+        for row in iter(cursor.fetchone_row, None):
+            if prompt is None or prompt.id != row[id_index]:
+                if prompt is not None:
+                    yield prompt
+                prompt = make_prompt(row)
+            if row[tag_index] is not None:
+                prompt.tags.append(row[tag_index])
+        if prompt is not None:
+            yield prompt
+
+    def list_prompts_by_tags(self, tags_list: List[str], user: Optional[User] = None) -> List[PromptRow]:
+        db = get_current_db_context()
+        sql = _LIST_PROMPTS_BY_TAGS_SQL.format(placeholders=_placeholders(len(tags_list)))
+        cursor = db.execute(sql, [*tags_list, _username(user)])
+        return list(map(_prompt_row_converter(cursor.column_names), cursor.fetchall_rows()))
 
-        # Base SQL query
-        sql = """
-            SELECT prompts.*, GROUP_CONCAT(tags.tag) as tags 
-            FROM prompts 
-            LEFT JOIN prompt_tags ON prompts.id = prompt_tags.prompt_id 
-            LEFT JOIN tags ON prompt_tags.tag_id = tags.id 
-        """
-
-        # Parameters for SQL query
-        params = []
-
-        # If user is not None, add the author clause and parameter
-        if user is not None:
-            sql += " WHERE prompts.author = %s"
-            params.append(user.username)
-        else:
-            sql += " WHERE prompts.author IS NULL"
+    def _update_tags(self, guid: str, tags: List[str], user: Optional[User] = None) -> None:
+        # Precondition: the prompt exists and belongs to user (checked or just created by the caller)
+        existing_tags = self._get_prompt_tags(guid, user)
+        new_tags = set(tags)
 
-        sql += " GROUP BY prompts.id"
+        # Only touch the rows that actually change
+        self._remove_tags_from_prompt(guid, [tag for tag in existing_tags if tag not in new_tags], user)
+        self._add_tags_to_prompt(guid, [tag for tag in dict.fromkeys(tags) if tag not in existing_tags], user)
 
-        db.cursor.execute(sql, params)
-        results = db.cursor.fetchall()
-        return [Prompt(**self.make_result_dict(result)) for result in results]
+    @staticmethod
+    def _get_prompt_tags(guid: str, user: Optional[User] = None) -> set:
+        db = get_current_db_context()
+        cursor = db.execute(_GET_PROMPT_TAGS_SQL, (guid, _username(user)))
+        return {row['tag'] for row in cursor.fetchall()}
+
+    @staticmethod
+    def _add_tags_to_prompt(guid: str, tags: List[str], user: Optional[User] = None) -> None:
+        if not tags:
+            return
 
-    def list_prompts_by_tags(self, tags_list: List[str], user: Optional[User] = None) -> List[Prompt]:
         db = get_current_db_context()
 
-        # Base SQL query
-        sql = """
-            SELECT prompts.*, GROUP_CONCAT(tags.tag) as tags
-            FROM prompts
-            LEFT JOIN prompt_tags ON prompts.id = prompt_tags.prompt_id
-            LEFT JOIN tags ON prompt_tags.tag_id = tags.id
-            WHERE tags.tag IN (%s)
-        """ % ', '.join(['%s'] * len(tags_list))
-
-        # Parameters for SQL query
-        params = tags_list
-
-        # If user is not None, add the author clause and parameter
-        if user is not None:
-            sql += " AND prompts.author = %s"
-            params.append(user.username)
-        else:
-            sql += " AND prompts.author IS NULL"
+        # Add any missing tags in a single multi-row insert: the connector's executemany rewrites an
+        # INSERT ... VALUES into one multi-row statement
+        db.executemany(_ADD_TAG_SQL, [(tag,) for tag in tags])
 
-        sql += " GROUP BY prompts.id"
+        # Link all tags to the prompt in a single insert
+        sql = _LINK_TAGS_SQL.format(placeholders=_placeholders(len(tags)))
+        db.execute(sql, [*tags, guid, _username(user)])
 
-        db.cursor.execute(sql, params)
-        results = db.cursor.fetchall()
-        return [Prompt(**self.make_result_dict(result)) for result in results]
+    @staticmethod
+    def _remove_tags_from_prompt(guid: str, tags: List[str], user: Optional[User] = None) -> None:
+        if not tags:
+            return
 
-    def _update_tags(self, guid: str, tags: List[str], user: Optional[User] = None) -> None:
-        self._check_prompt_ownership(guid, user)
-        # Remove all existing tags
-        self.remove_all_tags_from_prompt(guid, user)
-        # Add new tags
-        for tag in tags:
-            self.add_tag_to_prompt(guid, tag, user)
-
-    def remove_all_tags_from_prompt(self, guid: str, user: Optional[User] = None) -> None:
-        # Precondition: self._check_prompt_ownership(guid, user)
         db = get_current_db_context()
-        params = [guid]
-        remove_sql = """
-            DELETE prompt_tags 
-            FROM prompt_tags 
-            INNER JOIN prompts ON prompt_tags.prompt_id = prompts.id 
-            WHERE prompts.guid = %s
-        """
-        if user:
-            remove_sql += " AND prompts.author = %s"
-            params.append(user.username)
-        else:
-            remove_sql += " AND prompts.author IS NULL"
 
-        db.cursor.execute(remove_sql, params)
+        # Remove all dropped tags in a single delete
+        sql = _REMOVE_TAGS_SQL.format(placeholders=_placeholders(len(tags)))
+        db.execute(sql, [guid, *tags, _username(user)])
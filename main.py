@@ -1,13 +1,23 @@
 import traceback
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
-from core.exceptions import PromptException, EXCEPTION_STATUS_CODES
+from core.exceptions import PromptException
+from data import init_db_pool
 from web.middleware import LoggingMiddleware, RequestIdMiddleware
 from web.routers import public_prompts, private_prompts
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Open the pooled connections once, before the first request needs one
+    init_db_pool()
+    yield
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Register routers
 
@@ -22,8 +32,8 @@ app.add_middleware(RequestIdMiddleware)  # type: ignore
 
 @app.exception_handler(PromptException)
 async def handle_prompt_exception(_request: Request, exc: PromptException):
-    # Get the status code from our mapping or default to 500 if not found
-    status_code = EXCEPTION_STATUS_CODES.get(type(exc), 500)
+    # Each exception class carries its own status code (500 unless a subclass overrides it)
+    status_code = exc.status_code
     traceback_string = traceback.format_exc()
     return JSONResponse(status_code=status_code, content={"detail": str(exc), "traceback": traceback_string})
 
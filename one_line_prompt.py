@@ -1,16 +1,11 @@
-print("Enter your multiline string (press Enter twice to finish):")
-lines = []
-while True:
-    line = input()
-    if line:
-        lines.append(line)
-    else:
-        break
-multiline_string = '\n'.join(lines)
+import sys
 
 # Replace newline characters with \n
-one_line_string = multiline_string.replace('\n', '\\n')
+_TRANS = str.maketrans({'\n': '\\n'})
 
-print(f"""{one_line_string}""")
+print("Enter your multiline string (press Ctrl-D on an empty line to finish):")
+multiline_string = sys.stdin.read().rstrip('\n')
 
+one_line_string = multiline_string.translate(_TRANS)
 
+print(f"""{one_line_string}""")
@@ -1,11 +1,11 @@
 # service/prompt_service.py
 import traceback
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from pydantic import ValidationError
 
 from core.exceptions import PromptException, ConstraintViolationError, DataValidationError
-from core.models import Prompt, PromptCreate, PromptUpdate, User
+from core.models import PromptCreate, PromptRow, PromptUpdate, User
 from data import DatabaseContext
 from data.prompt_repository import PromptRepositoryInterface
 
@@ -59,7 +59,7 @@ class PromptServiceInterface:
         """
         pass
 
-    def get_prompt(self, guid: str, user: Optional[User] = None) -> Prompt:
+    def get_prompt(self, guid: str, user: Optional[User] = None) -> PromptRow:
         """
         Retrieves a prompt by its GUID.
 
@@ -67,7 +67,7 @@ class PromptServiceInterface:
             guid (str): The GUID of the prompt to retrieve.
 
         Returns:
-            Prompt: The retrieved prompt.
+            PromptRow: The retrieved prompt.
 
         Raises:
             PromptException: If an unexpected error occurs.
@@ -76,7 +76,7 @@ class PromptServiceInterface:
         """
         pass
 
-    def get_prompt_by_name(self, name: str, user: Optional[User] = None) -> Prompt:
+    def get_prompt_by_name(self, name: str, user: Optional[User] = None) -> PromptRow:
         """
         Retrieves a prompt by its display name.
 
@@ -84,7 +84,7 @@ class PromptServiceInterface:
             name (str): The name of the prompt to retrieve.
 
         Returns:
-            Prompt: The retrieved prompt.
+            PromptRow: The retrieved prompt.
 
         Raises:
             PromptException: If an unexpected error occurs.
@@ -125,19 +125,37 @@ class PromptServiceInterface:
         """
         pass
 
-    def list_prompts(self, user: Optional[User] = None) -> List[Prompt]:
+    def list_prompts(self, user: Optional[User] = None) -> List[PromptRow]:
         """
         Retrieves all prompts (public if there is no user), or private if there is a user provided.
 
         Returns:
-            List[Prompt]: A list of all prompts.
+            List[PromptRow]: A list of all prompts.
 
         Raises:
             PromptException: If an unexpected error occurs.
         """
         pass
 
-    def list_prompts_by_tags(self, tags: str, user: Optional[User] = None) -> List[Prompt]:
+    def list_prompts_stream(self, user: Optional[User] = None, skip: int = 0, limit: int = 100) -> Iterator[PromptRow]:
+        """
+        Streams one page of prompts (public if there is no user), or private if there is a user provided.
+        Prompts are yielded as they are read from the database, without loading the full page.
+        The iterator holds a pooled database connection until it is exhausted or closed.
+
+        Args:
+            skip (int): The number of prompts to skip.
+            limit (int): The maximum number of prompts to return.
+
+        Returns:
+            Iterator[PromptRow]: An iterator over the page of prompts.
+
+        Raises:
+            PromptException: If an unexpected error occurs.
+        """
+        pass
+
+    def list_prompts_by_tags(self, tags: str, user: Optional[User] = None) -> List[PromptRow]:
         """
         Retrieves all prompts that have at least one of the tags in the provided list.
         (returns public prompts if there is no user, or private if there is a user provided)
@@ -146,7 +164,7 @@ class PromptServiceInterface:
             tags Comma separated list of tags to filter by.
 
         Returns:
-            List[Prompt]: A list of all prompts that have at least one of the tags in the provided list.
+            List[PromptRow]: A list of all prompts that have at least one of the tags in the provided list.
 
         Raises:
             PromptException: If an unexpected error occurs.
@@ -165,17 +183,13 @@ class PromptService(PromptServiceInterface):
 
         with DatabaseContext() as db:
             try:
-                db.begin_transaction()
-                guid = self.prompt_repository.create_prompt(prompt, author)
-                db.commit_transaction()
-                return guid
+                with db.transaction():
+                    return self.prompt_repository.create_prompt(prompt, author)
             except PromptException as known_exc:
                 traceback.print_exc()
-                db.rollback_transaction()
                 raise known_exc
             except Exception as e:
                 traceback.print_exc()
-                db.rollback_transaction()
                 raise PromptException("An unexpected error occurred while processing your request.") from e
 
     def update_prompt(self, guid: str, prompt: PromptUpdate, user: Optional[User] = None) -> None:
@@ -186,34 +200,28 @@ class PromptService(PromptServiceInterface):
 
         with DatabaseContext() as db:
             try:
-                db.begin_transaction()
-                self.prompt_repository.update_prompt(guid, prompt, user)
-                db.commit_transaction()
+                with db.transaction():
+                    self.prompt_repository.update_prompt(guid, prompt, user)
             except PromptException as known_exc:
                 traceback.print_exc()
-                db.rollback_transaction()
                 raise known_exc
             except Exception as e:
                 traceback.print_exc()
-                db.rollback_transaction()
                 raise PromptException("An unexpected error occurred while processing your request.") from e
 
     def delete_prompt(self, guid: str, user: Optional[User] = None) -> None:
         with DatabaseContext() as db:
             try:
-                db.begin_transaction()
-                self.prompt_repository.delete_prompt(guid, user)
-                db.commit_transaction()
+                with db.transaction():
+                    self.prompt_repository.delete_prompt(guid, user)
             except PromptException as known_exc:
                 traceback.print_exc()
-                db.rollback_transaction()
                 raise known_exc
             except Exception as e:
                 traceback.print_exc()
-                db.rollback_transaction()
                 raise PromptException("An unexpected error occurred while processing your request.") from e
 
-    def get_prompt(self, guid: str, user: Optional[User] = None) -> Prompt:
+    def get_prompt(self, guid: str, user: Optional[User] = None) -> PromptRow:
         with DatabaseContext():
             try:
                 return self.prompt_repository.get_prompt(guid, user)
@@ -224,7 +232,7 @@ class PromptService(PromptServiceInterface):
                 traceback.print_exc()
                 raise PromptException("An unexpected error occurred while processing your request.") from e
 
-    def get_prompt_by_name(self, name: str, user: Optional[User] = None) -> Prompt:
+    def get_prompt_by_name(self, name: str, user: Optional[User] = None) -> PromptRow:
         with DatabaseContext():
             try:
                 return self.prompt_repository.get_prompt_by_name(name, user)
@@ -238,34 +246,28 @@ class PromptService(PromptServiceInterface):
     def add_tag_to_prompt(self, guid: str, tag: str, user: Optional[User] = None) -> None:
         with DatabaseContext() as db:
             try:
-                db.begin_transaction()
-                self.prompt_repository.add_tag_to_prompt(guid, tag, user)
-                db.commit_transaction()
+                with db.transaction():
+                    self.prompt_repository.add_tag_to_prompt(guid, tag, user)
             except PromptException as known_exc:
                 traceback.print_exc()
-                db.rollback_transaction()
                 raise known_exc
             except Exception as e:
                 traceback.print_exc()
-                db.rollback_transaction()
                 raise PromptException("An unexpected error occurred while processing your request.") from e
 
     def remove_tag_from_prompt(self, guid: str, tag: str, user: Optional[User] = None) -> None:
         with DatabaseContext() as db:
             try:
-                db.begin_transaction()
-                self.prompt_repository.remove_tag_from_prompt(guid, tag, user)
-                db.commit_transaction()
+                with db.transaction():
+                    self.prompt_repository.remove_tag_from_prompt(guid, tag, user)
             except PromptException as known_exc:
                 traceback.print_exc()
-                db.rollback_transaction()
                 raise known_exc
             except Exception as e:
                 traceback.print_exc()
-                db.rollback_transaction()
                 raise PromptException("An unexpected error occurred while processing your request.") from e
 
-    def list_prompts(self, user: Optional[User] = None) -> List[Prompt]:
+    def list_prompts(self, user: Optional[User] = None) -> List[PromptRow]:
         with DatabaseContext():
             try:
                 return self.prompt_repository.list_prompts(user)
@@ -276,7 +278,18 @@ class PromptService(PromptServiceInterface):
                 traceback.print_exc()
                 raise PromptException("An unexpected error occurred while processing your request.") from e
 
-    def list_prompts_by_tags(self, tags: str, user: Optional[User] = None) -> List[Prompt]:
+    def list_prompts_stream(self, user: Optional[User] = None, skip: int = 0, limit: int = 100) -> Iterator[PromptRow]:
+        with DatabaseContext():
+            try:
+                yield from self.prompt_repository.list_prompts_stream(user, skip, limit)
+            except PromptException as known_exc:
+                traceback.print_exc()
+                raise known_exc
+            except Exception as e:
+                traceback.print_exc()
+                raise PromptException("An unexpected error occurred while processing your request.") from e
+
+    def list_prompts_by_tags(self, tags: str, user: Optional[User] = None) -> List[PromptRow]:
         with DatabaseContext():
             try:
                 tags_list = tags.split(',')
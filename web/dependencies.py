@@ -1,3 +1,5 @@
+import hmac
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import Depends, HTTPException
@@ -11,27 +13,42 @@ from service.user_service import UserServiceInterface, UserService
 
 security = HTTPBasic()
 
+# The only user allowed to manage public prompts
+ADMIN_USERNAME = b"steve72"
 
+
+# Repositories and services hold no per-request state (the DB context is looked up per call),
+# so a single cached instance of each is shared across requests.
+@lru_cache(maxsize=1)
 def get_prompt_repository() -> PromptRepositoryInterface:
     return MySQLPromptRepository()
 
 
+@lru_cache(maxsize=1)
 def get_user_repository() -> UserRepositoryInterface:
     return MySQLUserRepository()
 
 
+@lru_cache(maxsize=1)
 def get_prompt_service(repo: PromptRepositoryInterface = Depends(get_prompt_repository)) -> PromptServiceInterface:
     return PromptService(repo)
 
 
+@lru_cache(maxsize=1)
 def get_user_service(repo: UserRepositoryInterface = Depends(get_user_repository)) -> UserServiceInterface:
     return UserService(repo)
 
 
+def _password_matches(credentials: HTTPBasicCredentials, user: User) -> bool:
+    # Constant-time comparison so response timing does not leak how much of the password matched
+    return hmac.compare_digest(credentials.password.encode(), user.password.encode())
+
+
 def require_admin_user(credentials: HTTPBasicCredentials = Depends(security),
                        user_service: UserService = Depends(get_user_service)) -> Optional[User]:
     user = user_service.authenticate_user(credentials.username)
-    if user is not None and credentials.password == user.password and user.username == "steve72":
+    if (user is not None and _password_matches(credentials, user)
+            and hmac.compare_digest(user.username.encode(), ADMIN_USERNAME)):
         return user
     return None
 
@@ -40,7 +57,7 @@ def require_current_user(credentials: HTTPBasicCredentials = Depends(security),
                          user_service: UserService = Depends(get_user_service)) -> User:
     user = user_service.authenticate_user(credentials.username)
 
-    if user is None or not credentials.password==user.password:
+    if user is None or not _password_matches(credentials, user):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     return user
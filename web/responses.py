@@ -0,0 +1,17 @@
+from typing import Iterator
+
+import orjson
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+# Largest page a single streamed listing may request
+MAX_STREAM_LIMIT = 1000
+
+
+def ndjson_response(items: Iterator) -> StreamingResponse:
+    # Stream items as JSON lines. A streamed listing holds a pooled DB connection until its generator
+    # finishes, so close it explicitly once the response ends, including when the client disconnects
+    # part way. Sync background tasks run in the threadpool, off the event loop.
+    return StreamingResponse((orjson.dumps(item) + b"\n" for item in items),
+                             media_type="application/x-ndjson",
+                             background=BackgroundTask(items.close))
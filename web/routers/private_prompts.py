@@ -6,6 +6,7 @@ from core.models import Prompt, User, PromptCreate, PromptUpdate
 from service.prompt_service import PromptServiceInterface
 from typing import List
 from web.dependencies import require_current_user, get_prompt_service
+from web.responses import MAX_STREAM_LIMIT, ndjson_response
 
 router = APIRouter()
 
@@ -36,6 +37,16 @@ def update_prompt(guid: str,
     return {}  # Return an empty response for 204 status
 
 
+# Registered ahead of /prompt/{guid}, and also without the trailing slash, since that route would
+# otherwise take "stream" as a guid
+@router.get("/prompt/stream", include_in_schema=False)
+@router.get("/prompt/stream/", summary="Stream all private prompts of the logged-in user as JSON lines.")
+def list_prompts_stream(skip: int = Query(0, ge=0), limit: int = Query(100, ge=1, le=MAX_STREAM_LIMIT),
+                        service: PromptServiceInterface = Depends(get_prompt_service),
+                        user: User = Depends(require_current_user)):
+    return ndjson_response(service.list_prompts_stream(user, skip=skip, limit=limit))
+
+
 @router.get("/prompt/{guid}", response_model=Prompt, summary="Retrieve a private prompt by GUID.")
 def get_prompt(guid: str, service: PromptServiceInterface = Depends(get_prompt_service),
                user: User = Depends(require_current_user)):
@@ -60,12 +71,12 @@ def list_prompts(skip: int = 0, limit: int = 10,
                  user: User = Depends(require_current_user)):
     return service.list_prompts(user)[skip: skip + limit]
 
+
 @router.get("/prompt/tags/", response_model=List[Prompt], summary="List Private Prompts by Tag")
 async def list_prompts_by_tag(tags: str = Query("", title="Tags", description="Comma-separated list of tags to search for"),
                              service: PromptServiceInterface = Depends(get_prompt_service),
                              user: User = Depends(require_current_user)):
-    list = service.list_prompts_by_tags(tags, user)
-    return list
+    return service.list_prompts_by_tags(tags, user)
 @router.post("/prompt/{guid}/tag/{tag}", status_code=204,
              summary="Add a tag to a private prompt by GUID. Requires the owner of the prompt.")
 def add_tag_to_prompt(guid: str, tag: str,
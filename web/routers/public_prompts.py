@@ -6,6 +6,7 @@ from core.models import Prompt, User, PromptCreate, PromptUpdate
 from service.prompt_service import PromptServiceInterface
 from typing import List
 from web.dependencies import get_prompt_service, require_admin_user
+from web.responses import MAX_STREAM_LIMIT, ndjson_response
 from urllib.parse import unquote_plus
 
 router = APIRouter()
@@ -35,6 +36,15 @@ def update_prompt(guid: str,
     return {}  # Return an empty response for 204 status
 
 
+# Registered ahead of /prompt/{guid}, and also without the trailing slash, since that route would
+# otherwise take "stream" as a guid
+@router.get("/prompt/stream", include_in_schema=False)
+@router.get("/prompt/stream/", summary="Stream all prompts as JSON lines.")
+def list_prompts_stream(skip: int = Query(0, ge=0), limit: int = Query(100, ge=1, le=MAX_STREAM_LIMIT),
+                        service: PromptServiceInterface = Depends(get_prompt_service)):
+    return ndjson_response(service.list_prompts_stream(skip=skip, limit=limit))
+
+
 @router.get("/prompt/{guid}", response_model=Prompt, summary="Retrieve a prompt by GUID.")
 def get_prompt(guid: str, service: PromptServiceInterface = Depends(get_prompt_service)):
     try:
@@ -56,6 +66,7 @@ def get_prompt_by_name(name: str, service: PromptServiceInterface = Depends(get_
 def list_prompts(skip: int = 0, limit: int = 10, service: PromptServiceInterface = Depends(get_prompt_service)):
     return service.list_prompts()[skip: skip + limit]
 
+
 @router.get("/prompt/tags/",
             response_model=List[Prompt], summary="List Public Prompts by Tag")
 def list_prompts_by_tag(